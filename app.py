@@ -1,10 +1,16 @@
 import sqlite3
+import sys
+import asyncio
+import functools
+import threading
+import time
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from shiny import App, render, ui, reactive
+from shiny import App, render, ui, reactive, req
 from faicons import icon_svg
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from shinywidgets import output_widget, render_widget
 
 # --- DATA LAYER (SQL) ---
@@ -14,68 +20,374 @@ from shinywidgets import output_widget, render_widget
 
 DB_PATH = Path(__file__).parent / "complaints.db"
 
-def get_filtered_data(date_range, countries, channels, categories, statuses):
-    conn = sqlite3.connect(DB_PATH)
-    
-    # Base query with filters
-    query = """
-    SELECT * FROM complaints 
-    WHERE date BETWEEN ? AND ?
+PAGE_SIZE = 1000
+FILTER_COLUMNS = ("country", "channel", "category", "status")
+# Columns (and their dtypes) shown in the detail view; the only path that reads raw rows
+DETAIL_COLUMNS = {
+    "complaint_id": np.int64,
+    "date": np.int64,
+    "country": np.int8,
+    "channel": np.int8,
+    "category": np.int8,
+    "status": np.int8,
+    "sla_hours": np.int64,
+    "amount": np.float64,
+    "is_escalated": np.int8,
+    "customer_id": object,
+}
+
+def make_filters(date_range, countries, channels, categories, statuses):
     """
-    params = [date_range[0], date_range[1]]
+    Normalize the filter inputs into a hashable, order-invariant tuple
+    so it can be used as a cache key by the query helpers below.
+    Dates become days since the Unix epoch (how they are stored) and
+    selections arrive as the string form of each dimension code.
+    """
+    return (
+        int(np.datetime64(date_range[0], 'D').astype(np.int64)),
+        int(np.datetime64(date_range[1], 'D').astype(np.int64)),
+        tuple(sorted(int(v) for v in countries)),
+        tuple(sorted(int(v) for v in channels)),
+        tuple(sorted(int(v) for v in categories)),
+        tuple(sorted(int(v) for v in statuses)),
+    )
+
+def _build_where(filters):
+    """Build the shared WHERE clause and its parameters from the filter inputs."""
+    date0, date1, *selections = filters
+    where = "WHERE date BETWEEN ? AND ?"
+    params = [date0, date1]
     
-    if countries:
-        query += f" AND country IN ({','.join(['?']*len(countries))})"
-        params.extend(countries)
-    if channels:
-        query += f" AND channel IN ({','.join(['?']*len(channels))})"
-        params.extend(channels)
-    if categories:
-        query += f" AND category IN ({','.join(['?']*len(categories))})"
-        params.extend(categories)
-    if statuses:
-        query += f" AND status IN ({','.join(['?']*len(statuses))})"
-        params.extend(statuses)
-        
-    df = pd.read_sql(query, conn, params=params)
-    conn.close()
+    for col, values in zip(FILTER_COLUMNS, selections):
+        if values:
+            where += f" AND {col} IN ({','.join(['?']*len(values))})"
+            params.extend(values)
+    
+    return where, params
+
+def _connect():
+    """
+    Open the shared read-only connection. The dashboard never writes, so a
+    single connection is reused for every query instead of reconnecting
+    (and re-parsing the schema) on each reactive tick. Parameterized
+    statements are prepared once and kept in sqlite3's statement cache.
+    """
+    conn = sqlite3.connect(
+        f"{DB_PATH.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False, cached_statements=256
+    )
+    conn.executescript("""
+    PRAGMA query_only=1;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA temp_store=MEMORY;
+    """)
+    return conn
+
+_CONN = None
+# Plots query from worker threads; serialize access to the shared connection
+_CONN_LOCK = threading.Lock()
+
+def _read_query(query, params=()):
+    with _CONN_LOCK:
+        cursor = _CONN.execute(query, params)
+        columns = [col[0] for col in cursor.description]
+        rows = cursor.fetchall()
+    return pd.DataFrame(rows, columns=columns)
+
+def _read_one(query, params=()):
+    """Read a single-row query as a {column: value} dict."""
+    with _CONN_LOCK:
+        cursor = _CONN.execute(query, params)
+        names = [col[0] for col in cursor.description]
+        row = cursor.fetchone()
+    return dict(zip(names, row))
+
+def _read_sql_fast(query, params, dtypes, max_rows, chunk_size=8192):
+    """
+    Read a query straight into typed NumPy columns, bypassing per-cell
+    DataFrame inference. `dtypes` maps each selected column to its dtype and
+    `max_rows` bounds the result (e.g. its LIMIT), so every column is
+    allocated once and filled in place from fetchmany chunks.
+    """
+    columns = {name: np.empty(max_rows, dtype) for name, dtype in dtypes.items()}
+    n = 0
+    with _CONN_LOCK:
+        cursor = _CONN.execute(query, params)
+        names = [col[0] for col in cursor.description]
+        if names != list(dtypes):
+            raise ValueError(f"Query returns columns {names}, expected {list(dtypes)}")
+        while chunk := cursor.fetchmany(chunk_size):
+            for col, values in zip(columns.values(), zip(*chunk)):
+                col[n:n + len(chunk)] = values
+            n += len(chunk)
+    return pd.DataFrame({name: col[:n] for name, col in columns.items()})
+
+@functools.lru_cache(maxsize=1)
+def get_dimensions():
+    """Names of each dimension, indexed by code, from the dim_* tables built by data_gen.py."""
+    return {
+        col: _read_query(f"SELECT name FROM dim_{col} ORDER BY code")['name'].tolist()
+        for col in FILTER_COLUMNS
+    }
+
+def get_filter_choices():
+    """Selectize choices ({code: name}, sorted by name) for each filter widget."""
+    return {
+        col: {str(code): name for code, name in sorted(enumerate(names), key=lambda c: c[1])}
+        for col, names in get_dimensions().items()
+    }
+
+def _parse_dates(df, col='date'):
+    """Convert stored day numbers to datetime64 once, at fetch time."""
+    df[col] = pd.to_datetime(df[col], unit='D', origin='unix')
+    return df
+
+def _decode(df, *cols):
+    """Map dimension codes back to their names (as pandas Categoricals) for display."""
+    dims = get_dimensions()
+    for col in cols:
+        df[col] = pd.Categorical.from_codes(df[col], categories=dims[col])
     return df
 
+@functools.lru_cache(maxsize=64)
+def get_kpis(filters):
+    """All four KPI scalars from a single aggregate pass, as a dict."""
+    where, params = _build_where(filters)
+    query = f"""
+    SELECT 
+        COALESCE(SUM(n), 0) AS n,
+        COALESCE(SUM(esc) * 100.0 / SUM(n), 0) AS escalation_rate,
+        COALESCE(SUM(sla_sum) * 1.0 / SUM(n), 0) AS avg_sla,
+        COALESCE(SUM(amt), 0) AS amount
+    FROM complaints_cube 
+    {where}
+    """
+    return _read_one(query, params)
+
+@functools.lru_cache(maxsize=64)
+def get_daily_counts(filters):
+    where, params = _build_where(filters)
+    query = f"""
+    SELECT date, SUM(n) AS count 
+    FROM complaints_cube 
+    {where}
+    GROUP BY date
+    ORDER BY date
+    """
+    return _parse_dates(_read_query(query, params))
+
+@functools.lru_cache(maxsize=64)
+def get_category_counts(filters):
+    where, params = _build_where(filters)
+    query = f"""
+    SELECT category, SUM(n) AS count 
+    FROM complaints_cube 
+    {where}
+    GROUP BY category
+    ORDER BY count ASC
+    """
+    return _decode(_read_query(query, params), 'category')
+
+@functools.lru_cache(maxsize=64)
+def get_country_counts(filters):
+    where, params = _build_where(filters)
+    query = f"""
+    SELECT country, SUM(n) AS count 
+    FROM complaints_cube 
+    {where}
+    GROUP BY country
+    ORDER BY count DESC
+    """
+    return _decode(_read_query(query, params), 'country')
+
+@functools.lru_cache(maxsize=64)
+def get_channel_status_counts(filters):
+    where, params = _build_where(filters)
+    query = f"""
+    SELECT channel, status, SUM(n) AS count 
+    FROM complaints_cube 
+    {where}
+    GROUP BY channel, status
+    """
+    return _decode(_read_query(query, params), 'channel', 'status')
+
+@functools.lru_cache(maxsize=64)
+def get_filtered_data(filters, offset=0, order=()):
+    """
+    Row-level detail, one page of PAGE_SIZE rows at a time. `order` is a
+    tuple of (column, descending) pairs; complaint_id breaks ties so paging
+    stays stable.
+    """
+    for col, _ in order:
+        if col not in DETAIL_COLUMNS:
+            raise ValueError(f"Cannot sort by unknown column {col!r}")
+    order_by = [f"{col} {'DESC' if desc else 'ASC'}" for col, desc in order]
+    
+    where, params = _build_where(filters)
+    query = f"""
+    SELECT {', '.join(DETAIL_COLUMNS)} 
+    FROM complaints 
+    {where}
+    ORDER BY {', '.join(order_by + ['complaint_id'])}
+    LIMIT {PAGE_SIZE} OFFSET ?
+    """
+    df = _read_sql_fast(query, params + [offset], DETAIL_COLUMNS, max_rows=PAGE_SIZE)
+    return _parse_dates(_decode(df, *FILTER_COLUMNS))
+
+@functools.lru_cache(maxsize=1)
 def get_complex_sql_metrics():
     """
     Example of a non-trivial SQL query using CTE and Window Functions.
     This query calculates the cumulative amount of complaints over time 
     and the rank of each category by volume within its country.
-    """
-    conn = sqlite3.connect(DB_PATH)
-    query = """
-    WITH DailyStats AS (
-        SELECT 
-            date,
-            category,
-            country,
-            COUNT(*) as daily_count,
-            SUM(amount) as daily_amount
-        FROM complaints
-        GROUP BY date, category, country
-    ),
-    RankedCategories AS (
-        SELECT 
-            *,
-            -- Window Function: Rank categories by volume within each country
-            RANK() OVER (PARTITION BY country ORDER BY daily_count DESC) as category_rank,
-            -- Window Function: Cumulative sum of amount over time
-            SUM(daily_amount) OVER (ORDER BY date ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) as cumulative_amount
-        FROM DailyStats
-    )
-    SELECT * FROM RankedCategories
-    LIMIT 100
+    The CTE itself lives in the `complex_metrics` view created by data_gen.py;
+    the result is cached until the database file changes.
     """
     # This query serves as a 'performance layer' by pre-aggregating complex metrics
     # that would be expensive to compute in-memory for very large datasets.
-    df = pd.read_sql(query, conn)
-    conn.close()
-    return df
+    return _parse_dates(_read_query("SELECT * FROM complex_metrics LIMIT 100"))
+
+# Query results are cached per filter combination; the caches are dropped
+# whenever the database file changes on disk.
+_CACHED_QUERIES = (
+    get_dimensions,
+    get_kpis,
+    get_daily_counts,
+    get_category_counts,
+    get_country_counts,
+    get_channel_status_counts,
+    get_filtered_data,
+    get_complex_sql_metrics,
+)
+_db_mtime = None
+
+def invalidate_stale_cache():
+    global _CONN, _db_mtime
+    mtime = DB_PATH.stat().st_mtime
+    if mtime != _db_mtime:
+        # The file may have been regenerated, so reopen the connection too
+        with _CONN_LOCK:
+            if _CONN is not None:
+                _CONN.close()
+            _CONN = _connect()
+        for fn in _CACHED_QUERIES:
+            fn.cache_clear()
+        _db_mtime = mtime
+
+invalidate_stale_cache()
+# The metrics take no filters, so compute them once at startup
+get_complex_sql_metrics()
+
+# --- PLOT HELPERS ---
+
+# Shared pool for running queries and figure construction off the event loop.
+# Pyodide (Shinylive) cannot start threads, so there the work runs inline.
+_EXECUTOR = None if sys.platform == "emscripten" else ThreadPoolExecutor(max_workers=4)
+
+async def run_in_thread(fn, *args):
+    if _EXECUTOR is None:
+        return fn(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, fn, *args)
+
+# Figure layouts and trace styles are built once here; each render only
+# supplies the data.
+_TS_LINE = dict(color='#3b82f6', width=3, shape='spline', smoothing=1.3)
+_TS_LAYOUT = go.Layout(
+    template="plotly_white",
+    margin=dict(l=80, r=30, t=30, b=80),
+    height=400,
+    showlegend=False,
+    xaxis=dict(
+        title=None,
+        showgrid=False,
+        zeroline=False,
+        tickangle=-45,
+        automargin=True
+    ),
+    yaxis=dict(
+        title="Complaints",
+        title_font=dict(size=14),
+        showgrid=True,
+        automargin=True,
+        gridcolor='#f1f5f9',
+        zeroline=False,
+        rangemode='tozero'
+    ),
+    hovermode="x unified",
+    plot_bgcolor='white'
+)
+
+_CATEGORY_LAYOUT = go.Layout(
+    template="plotly_white",
+    margin=dict(l=20, r=30, t=30, b=30),
+    yaxis=dict(title=None, automargin=True, tickfont=dict(size=12)),
+    xaxis=dict(automargin=True, title="Count")
+)
+
+_COUNTRY_LAYOUT = go.Layout(
+    template="plotly_white",
+    margin=dict(l=0, r=0, t=20, b=0),
+    height=400
+)
+
+_CHANNEL_LAYOUT = go.Layout(
+    template="plotly_white",
+    margin=dict(l=0, r=0, t=20, b=0),
+    height=400,
+    barmode='group',
+    legend=dict(title="status"),
+    xaxis=dict(title="channel"),
+    yaxis=dict(title="count")
+)
+
+def build_time_series_fig(df):
+    # Roll the daily counts up to months with a bincount over month offsets
+    months = df['date'].to_numpy().astype('datetime64[M]')
+    month_idx = (months - months[0]).astype(np.int64)
+    counts = np.bincount(month_idx, weights=df['count'].to_numpy()).astype(np.int64)
+    
+    # Create formatted labels for x-axis (YYYY-MM format)
+    month_labels = np.datetime_as_string(months[0] + np.arange(len(counts)), unit='M')
+    
+    # Create the figure manually with go.Scatter for better control
+    fig = go.Figure(layout=_TS_LAYOUT)
+    
+    # Add the area trace
+    fig.add_trace(go.Scatter(
+        x=month_labels,
+        y=counts,
+        mode='lines',
+        name='Complaints',
+        line=_TS_LINE,
+        fill='tozeroy',
+        fillcolor='rgba(59, 130, 246, 0.15)',
+        hovertemplate='%{x}<br>%{y} complaints<extra></extra>'
+    ))
+    return fig
+
+def build_category_fig(df_cat):
+    fig = go.Figure(
+        go.Bar(x=df_cat['count'], y=df_cat['category'], orientation='h', marker_color='#3498db'),
+        layout=_CATEGORY_LAYOUT
+    )
+    # Dynamic height based on number of categories
+    # Minimum 250px, 40px per category for compact display
+    fig.layout.height = max(250, len(df_cat) * 40)
+    return fig
+
+def build_country_fig(df_country):
+    return go.Figure(
+        go.Pie(labels=df_country['country'], values=df_country['count'], hole=.4),
+        layout=_COUNTRY_LAYOUT
+    )
+
+def build_channel_fig(df_chan):
+    fig = go.Figure(layout=_CHANNEL_LAYOUT)
+    # One bar trace per status, grouped by channel
+    for status, group in df_chan.groupby('status', observed=True):
+        fig.add_trace(go.Bar(x=group['channel'], y=group['count'], name=status))
+    return fig
 
 # --- UI DEFINITION ---
 
@@ -151,6 +463,16 @@ app_ui = ui.page_navbar(
                 ui.card_header("Channel Performance"),
                 output_widget("channel_bar_plot")
             )
+        ),
+        # Detail rows are fetched one page at a time from the database
+        ui.card(
+            ui.card_header(
+                "Complaint Details",
+                ui.output_text("page_summary", inline=True),
+                class_="d-flex justify-content-between align-items-center"
+            ),
+            ui.input_numeric("page", "Page", value=1, min=1, width="120px"),
+            ui.output_data_frame("complaints_table")
         )
     ),
     title="CX Complaints Insights",
@@ -159,6 +481,54 @@ app_ui = ui.page_navbar(
     fillable=True
 )
 
+# --- REACTIVE HELPERS ---
+
+def debounce(delay_secs):
+    """
+    Turn a function of reactive inputs into a reactive calc that only
+    updates once its value has been stable for `delay_secs`, so a burst of
+    input changes triggers a single downstream recompute. The first value
+    is published immediately. Must be used inside the server function.
+    """
+    def wrapper(fn):
+        pending = reactive.calc(fn)
+        settled = reactive.value(None)
+        deadline = reactive.value(None)
+
+        @reactive.effect
+        def _schedule():
+            value = pending()
+            with reactive.isolate():
+                if settled() is None:
+                    settled.set(value)
+                else:
+                    deadline.set(time.monotonic() + delay_secs)
+
+        @reactive.effect
+        def _publish():
+            due = deadline()
+            if due is None:
+                return
+            remaining = due - time.monotonic()
+            if remaining > 0:
+                reactive.invalidate_later(remaining)
+                return
+            with reactive.isolate():
+                deadline.set(None)
+                value = pending()
+                # Only wake dependents if the settled value actually changed
+                if value != settled():
+                    settled.set(value)
+
+        @reactive.calc
+        def debounced():
+            value = settled()
+            req(value is not None)
+            return value
+
+        return debounced
+    return wrapper
+
 # --- SERVER LOGIC ---
 
 def server(input, output, session):
@@ -166,19 +536,19 @@ def server(input, output, session):
     # Initialize filter choices
     @reactive.Effect
     def _():
-        conn = sqlite3.connect(DB_PATH)
-        df = pd.read_sql("SELECT DISTINCT country, channel, category, status FROM complaints", conn)
-        conn.close()
+        choices = get_filter_choices()
         
-        ui.update_selectize("country", choices=sorted(df['country'].unique().tolist()))
-        ui.update_selectize("channel", choices=sorted(df['channel'].unique().tolist()))
-        ui.update_selectize("category", choices=sorted(df['category'].unique().tolist()))
-        ui.update_selectize("status", choices=sorted(df['status'].unique().tolist()))
+        ui.update_selectize("country", choices=choices['country'])
+        ui.update_selectize("channel", choices=choices['channel'])
+        ui.update_selectize("category", choices=choices['category'])
+        ui.update_selectize("status", choices=choices['status'])
 
-    # Reactive data subset
-    @reactive.calc
-    def filtered_df():
-        return get_filtered_data(
+    # Current filter selection, shared by every aggregate query. Debounced so
+    # rapid multi-select changes coalesce into a single recompute.
+    @debounce(0.3)
+    def filters():
+        invalidate_stale_cache()
+        return make_filters(
             input.date_range(),
             input.country(),
             input.channel(),
@@ -186,147 +556,112 @@ def server(input, output, session):
             input.status()
         )
 
-    # KPI Calculations
+    # KPI Calculations (a single aggregate row shared by all four cards)
+    @reactive.calc
+    def kpis():
+        return get_kpis(filters())
+
     @render.ui
     def total_complaints():
-        return ui.span(f"{len(filtered_df()):,}", class_="kpi-value")
+        return ui.span(f"{kpis()['n']:,}", class_="kpi-value")
 
     @render.ui
     def escalation_rate():
-        df = filtered_df()
-        if len(df) == 0: return ui.span("0.0%", class_="kpi-value")
-        rate = (df['is_escalated'].sum() / len(df)) * 100
-        return ui.span(f"{rate:.1f}%", class_="kpi-value")
+        return ui.span(f"{kpis()['escalation_rate']:.1f}%", class_="kpi-value")
 
     @render.ui
     def avg_sla():
-        df = filtered_df()
-        if len(df) == 0: return ui.span("0.0", class_="kpi-value")
-        return ui.span(f"{df['sla_hours'].mean():.1f}", class_="kpi-value")
+        return ui.span(f"{kpis()['avg_sla']:.1f}", class_="kpi-value")
 
     @render.ui
     def total_amount():
-        df = filtered_df()
-        if len(df) == 0: return ui.span("$0", class_="kpi-value")
-        return ui.span(f"${df['amount'].sum():,.0f}", class_="kpi-value")
+        return ui.span(f"${kpis()['amount']:,.0f}", class_="kpi-value")
 
     # Visualizations
+    # Queries and figure construction run on the shared thread pool, which
+    # keeps them off the session event loop. They are not parallel: queries
+    # share one locked connection and figure builds still hold the GIL.
     @render_widget
-    def time_series_plot():
-        df = filtered_df().copy()
+    async def time_series_plot():
+        df = await run_in_thread(get_daily_counts, filters())
         if df.empty: 
             return ui.div("No data available for selected filters.")
-        
-        # Convert to datetime and extract year-month
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-        df = df.dropna(subset=['date'])
-        
-        if df.empty:
-            return ui.div("No valid date data available.")
-        
-        # Create year-month column for aggregation
-        df['year_month'] = df['date'].dt.to_period('M')
-        
-        # Aggregate by month
-        df_monthly = df.groupby('year_month').size().reset_index(name='count')
-        df_monthly = df_monthly.sort_values('year_month')
-        
-        # Convert period back to timestamp for plotting
-        df_monthly['date'] = df_monthly['year_month'].dt.to_timestamp()
-        
-        # Create formatted labels for x-axis (YYYY-MM format)
-        df_monthly['month_label'] = df_monthly['year_month'].astype(str)
-        
-        # Create the figure manually with go.Scatter for better control
-        fig = go.Figure()
-        
-        # Add the area trace
-        fig.add_trace(go.Scatter(
-            x=df_monthly['month_label'],
-            y=df_monthly['count'],
-            mode='lines',
-            name='Complaints',
-            line=dict(
-                color='#3b82f6',
-                width=3,
-                shape='spline',
-                smoothing=1.3
-            ),
-            fill='tozeroy',
-            fillcolor='rgba(59, 130, 246, 0.15)',
-            hovertemplate='%{x}<br>%{y} complaints<extra></extra>'
-        ))
-        
-        fig.update_layout(
-            template="plotly_white",
-            margin=dict(l=80, r=30, t=30, b=80),
-            height=400,
-            showlegend=False,
-            xaxis=dict(
-                title=None,
-                showgrid=False,
-                zeroline=False,
-                tickangle=-45,
-                automargin=True
-            ),
-            yaxis=dict(
-                title="Complaints",
-                title_font=dict(size=14),
-                showgrid=True,
-                automargin=True,
-                gridcolor='#f1f5f9',
-                zeroline=False,
-                rangemode='tozero'
-            ),
-            hovermode="x unified",
-            plot_bgcolor='white'
-        )
-        
-        return fig
+        return await run_in_thread(build_time_series_fig, df)
 
     @render_widget
-    def category_bar_plot():
-        df = filtered_df()
-        if df.empty: return ui.div("No data available.")
-        
-        df_cat = df.groupby('category').size().reset_index(name='count').sort_values('count', ascending=True)
-        
-        # Calculate dynamic height based on number of categories
-        # Minimum 250px, 40px per category for compact display
-        num_categories = len(df_cat)
-        dynamic_height = max(250, num_categories * 40)
-        
-        fig = px.bar(df_cat, x='count', y='category', orientation='h', template="plotly_white")
-        fig.update_traces(marker_color='#3498db')
-        fig.update_layout(
-            margin=dict(l=20, r=30, t=30, b=30), 
-            height=dynamic_height, 
-            yaxis_title=None,
-            yaxis=dict(automargin=True, tickfont=dict(size=12)),
-            xaxis=dict(automargin=True, title="Count")
-        )
-        return fig
+    async def category_bar_plot():
+        df_cat = await run_in_thread(get_category_counts, filters())
+        if df_cat.empty: return ui.div("No data available.")
+        return await run_in_thread(build_category_fig, df_cat)
 
 
     # Drill-down Visuals
     @render_widget
-    def country_rank_plot():
-        df = filtered_df()
-        if df.empty: return ui.div("No data.")
-        
-        df_country = df.groupby('country').size().reset_index(name='count').sort_values('count', ascending=False)
-        fig = px.pie(df_country, values='count', names='country', hole=.4, template="plotly_white")
-        fig.update_layout(margin=dict(l=0, r=0, t=20, b=0), height=400)
-        return fig
+    async def country_rank_plot():
+        df_country = await run_in_thread(get_country_counts, filters())
+        if df_country.empty: return ui.div("No data.")
+        return await run_in_thread(build_country_fig, df_country)
 
     @render_widget
-    def channel_bar_plot():
-        df = filtered_df()
-        if df.empty: return ui.div("No data.")
-        
-        df_chan = df.groupby(['channel', 'status']).size().reset_index(name='count')
-        fig = px.bar(df_chan, x='channel', y='count', color='status', barmode='group', template="plotly_white")
-        fig.update_layout(margin=dict(l=0, r=0, t=20, b=0), height=400)
-        return fig
+    async def channel_bar_plot():
+        df_chan = await run_in_thread(get_channel_status_counts, filters())
+        if df_chan.empty: return ui.div("No data.")
+        return await run_in_thread(build_channel_fig, df_chan)
+
+    # Detail table (server-side paging). The current page lives on the
+    # server so a filter change resets it within the same flush, before the
+    # table re-queries, rather than waiting on the client round-trip.
+    current_page = reactive.value(1)
+
+    @reactive.effect(priority=1)
+    @reactive.event(filters)
+    def _():
+        current_page.set(1)
+        ui.update_numeric("page", value=1)
+
+    @reactive.effect(priority=1)
+    @reactive.event(input.page)
+    def _():
+        current_page.set(int(input.page() or 1))
+
+    @reactive.calc
+    def page_offset():
+        n_pages = max(1, -(-kpis()['n'] // PAGE_SIZE))
+        page = min(max(current_page(), 1), n_pages)
+        return (page - 1) * PAGE_SIZE
+
+    @render.text
+    def page_summary():
+        n = kpis()['n']
+        if n == 0: return "No rows"
+        offset = page_offset()
+        return f"Rows {offset + 1:,}-{min(offset + PAGE_SIZE, n):,} of {n:,}"
+
+    def table_view(df):
+        # Show the day only, without the midnight timestamp
+        return df.assign(date=df['date'].dt.strftime('%Y-%m-%d'))
+
+    # Sorting happens in SQL across all filtered rows, not just the visible
+    # page. A full re-render clears the grid's sort, so the render uses the
+    # default order and sort changes are pushed with update_data().
+    applied_order = reactive.value(())
+
+    @render.data_frame
+    async def complaints_table():
+        df = await run_in_thread(get_filtered_data, filters(), page_offset())
+        applied_order.set(())
+        return render.DataGrid(table_view(df), width="100%", summary=False)
+
+    @reactive.effect
+    @reactive.event(complaints_table.sort)
+    async def _():
+        columns = list(DETAIL_COLUMNS)
+        order = tuple((columns[s["col"]], s["desc"]) for s in complaints_table.sort())
+        with reactive.isolate():
+            if order == applied_order():
+                return
+            applied_order.set(order)
+            df = await run_in_thread(get_filtered_data, filters(), page_offset(), order)
+        await complaints_table.update_data(table_view(df))
 
 app = App(app_ui, server)
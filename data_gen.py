@@ -1,7 +1,6 @@
 import sqlite3
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 import os
 
 def generate_data(n=1000):
@@ -13,23 +12,23 @@ def generate_data(n=1000):
     categories = ["Billing", "Technical Support", "Product Quality", "Shipping", "Account Access"]
     statuses = ["Open", "Closed", "In Progress", "Escalated", "Resolved"]
     
-    start_date = datetime(2025, 1, 1)
+    # Dates are stored as days since the Unix epoch (INTEGER)
+    start_day = np.datetime64("2025-01-01", "D").astype(np.int64)
     
     data = {
         "complaint_id": range(1, n + 1),
-        "date": [start_date + timedelta(days=np.random.randint(0, 365)) for _ in range(n)],
+        "date": start_day + np.random.randint(0, 365, n),
         "country": np.random.choice(countries, n),
         "channel": np.random.choice(channels, n),
         "category": np.random.choice(categories, n),
         "status": np.random.choice(statuses, n),
         "sla_hours": np.random.randint(12, 120, n),
         "amount": np.random.uniform(10, 500, n).round(2),
-        "customer_id": [f"CUST-{np.random.randint(1000, 9999)}" for _ in range(n)],
+        "customer_id": np.char.add("CUST-", np.random.randint(1000, 9999, n).astype("U4")),
         "is_escalated": np.random.choice([0, 1], n, p=[0.85, 0.15])
     }
     
     df = pd.DataFrame(data)
-    df['date'] = df['date'].dt.strftime('%Y-%m-%d')
     
     # Create SQLite database
     db_path = "complaints.db"
@@ -37,7 +36,98 @@ def generate_data(n=1000):
         os.remove(db_path)
         
     conn = sqlite3.connect(db_path)
-    df.to_sql("complaints", conn, index=False, if_exists="replace")
+    
+    # Store the low-cardinality columns as integer codes, with one small
+    # dim_<column>(code, name) lookup table per dimension. The dimension
+    # tables also provide the filter choices, so the app never has to run
+    # a DISTINCT over the full fact table to populate its widgets.
+    for col in ["country", "channel", "category", "status"]:
+        cat = pd.Categorical(df[col])
+        df[col] = cat.codes
+        dim = pd.DataFrame({"code": range(len(cat.categories)), "name": cat.categories})
+        dim.to_sql(f"dim_{col}", conn, index=False, if_exists="replace")
+    
+    # Bulk-load the fact table in a single transaction. Journaling and
+    # fsyncs are pointless here since the file is rebuilt from scratch.
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("""
+    CREATE TABLE complaints (
+        complaint_id INTEGER PRIMARY KEY,
+        date INTEGER,
+        country INTEGER,
+        channel INTEGER,
+        category INTEGER,
+        status INTEGER,
+        sla_hours INTEGER,
+        amount REAL,
+        customer_id TEXT,
+        is_escalated INTEGER
+    )
+    """)
+    with conn:
+        conn.executemany(
+            "INSERT INTO complaints VALUES (?,?,?,?,?,?,?,?,?,?)",
+            df.itertuples(index=False, name=None)
+        )
+    
+    # Daily rollup over every filter dimension. All KPI and plot aggregates
+    # read this instead of the raw rows. At this grain (day x four
+    # dimensions) it is only smaller than the fact table when several
+    # complaints share a cell; the gain comes mostly from its narrow rows.
+    conn.execute("""
+    CREATE TABLE complaints_cube AS
+    SELECT 
+        date, country, channel, category, status,
+        COUNT(*) AS n,
+        SUM(is_escalated) AS esc,
+        SUM(sla_hours) AS sla_sum,
+        SUM(amount) AS amt
+    FROM complaints
+    GROUP BY 1, 2, 3, 4, 5
+    """)
+    
+    # CTE + window-function metrics, defined once as a view (see get_complex_sql_metrics)
+    conn.execute("""
+    CREATE VIEW complex_metrics AS
+    WITH DailyStats AS (
+        SELECT 
+            c.date,
+            cat.name as category,
+            ctry.name as country,
+            SUM(c.n) as daily_count,
+            SUM(c.amt) as daily_amount
+        FROM complaints_cube c
+        JOIN dim_category cat ON cat.code = c.category
+        JOIN dim_country ctry ON ctry.code = c.country
+        GROUP BY c.date, c.category, c.country
+    ),
+    RankedCategories AS (
+        SELECT 
+            *,
+            -- Window Function: Rank categories by volume within each country
+            RANK() OVER (PARTITION BY country ORDER BY daily_count DESC) as category_rank,
+            -- Window Function: Cumulative sum of amount over time
+            SUM(daily_amount) OVER (ORDER BY date ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) as cumulative_amount
+        FROM DailyStats
+    )
+    SELECT * FROM RankedCategories
+    """)
+    
+    # Indexes for the dashboard filters, plus statistics for the query planner.
+    # On complaints they only serve the detail table, which pages in
+    # complaint_id (rowid) order: the categorical indexes keep rows in rowid
+    # order, but a date index would force a sort of every match on each page,
+    # so date ranges are left to the rowid scan, which stops after one page.
+    conn.executescript("""
+    CREATE INDEX ix_country ON complaints(country);
+    CREATE INDEX ix_channel ON complaints(channel);
+    CREATE INDEX ix_category ON complaints(category);
+    CREATE INDEX ix_status ON complaints(status);
+    -- Covering index: aggregates never have to visit the cube's rows
+    CREATE INDEX ix_cube ON complaints_cube(date, country, channel, category, status, n, esc, sla_sum, amt);
+    """)
+    conn.execute("ANALYZE")
     conn.close()
     print(f"Database created at {db_path} with {n} records.")
 